@@ -7,18 +7,20 @@ This script uses the KaggleApi from the kaggle package. Make sure you have
 placed your `kaggle.json` in `%USERPROFILE%/.kaggle/kaggle.json` and that
 it is not committed to the repo (it's added to .gitignore).
 """
+from functools import lru_cache
 from pathlib import Path
 import sys
 
+_KAGGLE_TOKEN = Path.home() / ".kaggle" / "kaggle.json"
 
-def download_dataset(owner_dataset: str, dest: str = "data", unzip: bool = True) -> None:
-    # Ensure the kaggle.json token exists
-    kaggle_token = Path.home() / ".kaggle" / "kaggle.json"
-    if not kaggle_token.exists():
-        print(f"Kaggle API token not found at: {kaggle_token}")
-        print("Create one at https://www.kaggle.com/ -> Account -> Create API Token and place it at the path above.")
-        raise FileNotFoundError(kaggle_token)
 
+@lru_cache(maxsize=1)
+def _get_api():
+    """Import and authenticate the Kaggle API once per process.
+
+    The kaggle import is deferred to here because it pulls in a large
+    dependency chain; repeated downloads reuse the authenticated client.
+    """
     try:
         from kaggle.api.kaggle_api_extended import KaggleApi
     except Exception as exc:
@@ -27,6 +29,17 @@ def download_dataset(owner_dataset: str, dest: str = "data", unzip: bool = True)
 
     api = KaggleApi()
     api.authenticate()
+    return api
+
+
+def download_dataset(owner_dataset: str, dest: str = "data", unzip: bool = True) -> None:
+    # Ensure the kaggle.json token exists
+    if not _KAGGLE_TOKEN.exists():
+        print(f"Kaggle API token not found at: {_KAGGLE_TOKEN}")
+        print("Create one at https://www.kaggle.com/ -> Account -> Create API Token and place it at the path above.")
+        raise FileNotFoundError(_KAGGLE_TOKEN)
+
+    api = _get_api()
 
     dest_path = Path(dest)
     dest_path.mkdir(parents=True, exist_ok=True)
@@ -1,6 +1,47 @@
 from pathlib import Path
+import functools
 import re
+from statistics import fmean
+import warnings
 import numpy as np
+import pandas as pd
+
+
+# Patterns are compiled once at import; the parsers below run once per cell.
+_TOKEN_RE = re.compile(r"([0-9]*\.?[0-9]+\s*[kKmM]?)")
+_TOKEN_PARTS_RE = re.compile(r"([0-9]*\.?[0-9]+)\s*([kKmM]?)")
+_CURRENCY_RE = re.compile(r"[,\$£€]")
+_SUFFIX_MULT = {'k': 1e3, 'm': 1e6}
+
+DATA_PATH = Path(__file__).resolve().parents[2] / "data" / "Cars Datasets 2025.csv"
+
+# Cars dataset spec columns parsed with the extract_number rules (output name -> raw column)
+NUMERIC_SPEC_COLUMNS = {
+    'horsepower': 'HorsePower',
+    'cc': 'CC/Battery Capacity',
+    'perf_sec': 'Performance(0 - 100 )KM/H',
+    'torque': 'Torque',
+}
+
+
+def read_csv_fast(path, encoding: str = 'latin1') -> pd.DataFrame:
+    """Read a CSV with the multithreaded PyArrow reader when it is installed.
+
+    Columns come back Arrow-backed (``pd.ArrowDtype``) so the ``Series.str``
+    parsers below run on Arrow strings. Falls back to ``pd.read_csv`` when
+    pyarrow is not available.
+    """
+    try:
+        import pyarrow.csv as pacsv  # type: ignore
+    except ImportError:
+        return pd.read_csv(path, encoding=encoding)
+
+    table = pacsv.read_csv(
+        str(path),
+        read_options=pacsv.ReadOptions(encoding=encoding),
+        parse_options=pacsv.ParseOptions(delimiter=','),
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
 
 
 def _num_with_suffix_to_float(s: str) -> float:
@@ -14,21 +55,17 @@ def _num_with_suffix_to_float(s: str) -> float:
     if not isinstance(s, str):
         return np.nan
     s = s.strip()
-    if s == "":
+    # the suffix is always the last character, so no regex is needed here
+    mult = 1.0
+    last = s[-1:]
+    if last and last in "kK":
+        mult, s = 1e3, s[:-1]
+    elif last and last in "mM":
+        mult, s = 1e6, s[:-1]
+    try:
+        return float(s) * mult
+    except ValueError:
         return np.nan
-    m = re.match(r"^([0-9]*\.?[0-9]+)\s*([kKmM]?)$", s)
-    if not m:
-        try:
-            return float(s)
-        except Exception:
-            return np.nan
-    num = float(m.group(1))
-    suf = m.group(2).lower()
-    if suf == 'k':
-        num *= 1_000
-    elif suf == 'm':
-        num *= 1_000_000
-    return num
 
 
 def parse_price(s: str) -> float:
@@ -46,7 +83,7 @@ def parse_price(s: str) -> float:
         return np.nan
 
     # remove common currency symbols but keep digits, dots, minus and suffix letters
-    s_clean = re.sub(r"[,\$£€]", "", s)
+    s_clean = _CURRENCY_RE.sub("", s)
 
     # If range separated by '-', try to parse endpoints
     if '-' in s_clean:
@@ -54,15 +91,15 @@ def parse_price(s: str) -> float:
         vals = []
         for p in parts:
             # extract first token that looks like a number with optional suffix
-            m = re.search(r"([0-9]*\.?[0-9]+\s*[kKmM]?)", p)
+            m = _TOKEN_RE.search(p)
             if m:
                 vals.append(_num_with_suffix_to_float(m.group(1).replace(' ', '')))
         if vals:
-            return float(sum(vals) / len(vals))
+            return fmean(vals)
         return np.nan
 
     # otherwise extract first numeric token (with optional suffix)
-    m = re.search(r"([0-9]*\.?[0-9]+\s*[kKmM]?)", s_clean)
+    m = _TOKEN_RE.search(s_clean)
     if not m:
         return np.nan
     return float(_num_with_suffix_to_float(m.group(1).replace(' ', '')))
@@ -83,7 +120,7 @@ def extract_number(s: str) -> float:
     # remove commas
     s_no_comma = s.replace(',', ' ')
     # find all numeric tokens possibly with k/M suffix
-    matches = re.findall(r"([0-9]*\.?[0-9]+\s*[kKmM]?)", s_no_comma)
+    matches = _TOKEN_RE.findall(s_no_comma)
     if not matches:
         return np.nan
     vals = []
@@ -93,4 +130,94 @@ def extract_number(s: str) -> float:
             vals.append(v)
     if not vals:
         return np.nan
-    return float(sum(vals) / len(vals))
+    return fmean(vals)
+
+
+def _suffix_multiplier(suf: pd.Series) -> np.ndarray:
+    """Return the k/M multiplier for each suffix in ``suf`` (1.0 when absent)."""
+    return suf.str.lower().map(_SUFFIX_MULT).fillna(1.0).to_numpy(dtype=float)
+
+
+def _extract_num_with_suffix(s: pd.Series) -> np.ndarray:
+    """Vectorized equivalent of searching each cell for its first numeric token.
+
+    Returns a float array (np.nan where no numeric token was found).
+    """
+    parts = s.str.extract(_TOKEN_PARTS_RE, expand=True)
+    nums = pd.to_numeric(parts[0], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    return nums * _suffix_multiplier(parts[1])
+
+
+def parse_price_series(s: pd.Series) -> pd.Series:
+    """Vectorized version of :func:`parse_price` over a whole column.
+
+    Same rules as the scalar parser: currency symbols and commas are
+    stripped, ranges like "$12,000-$15,000" return the midpoint and k/M
+    suffixes are expanded.
+    """
+    if s.empty:
+        return pd.Series(np.nan, index=s.index, name=s.name, dtype=float)
+    s2 = s.astype('string').str.replace(_CURRENCY_RE, "", regex=True).str.strip()
+    endpoints = s2.str.split('-', expand=True)
+    vals = np.column_stack([_extract_num_with_suffix(endpoints[c]) for c in endpoints.columns])
+    with warnings.catch_warnings():
+        # rows with no numeric token at all are expected to come back as NaN
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        out = np.nanmean(vals, axis=1)
+    return pd.Series(out, index=s.index, name=s.name)
+
+
+def extract_number_series(s: pd.Series) -> pd.Series:
+    """Vectorized version of :func:`extract_number` over a whole column.
+
+    Every numeric token (with optional k/M suffix) in a cell is extracted
+    and the per-cell mean is returned; cells without numbers become NaN.
+    """
+    # extract on a positional index so duplicate labels are not averaged together
+    s2 = s.reset_index(drop=True).astype('string').str.replace(',', ' ', regex=False)
+    parts = s2.str.extractall(_TOKEN_PARTS_RE)
+    nums = pd.to_numeric(parts[0], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    vals = pd.Series(nums * _suffix_multiplier(parts[1]), index=parts.index, dtype=float)
+    out = vals.groupby(level=0).mean().reindex(range(len(s)))
+    return pd.Series(out.to_numpy(), index=s.index, name=s.name)
+
+
+def parse_numeric_columns(df: pd.DataFrame, columns: dict) -> pd.DataFrame:
+    """Parse several raw columns with :func:`extract_number_series` in one sweep.
+
+    ``columns`` maps output column names to raw column names in ``df``. The raw
+    columns are stacked into a single Series so the regex extraction runs once
+    rather than once per column, then split back into one column per output.
+    """
+    names = list(columns)
+    stacked = pd.concat([df[columns[n]].astype('string') for n in names], ignore_index=True)
+    parsed = extract_number_series(stacked).to_numpy()
+    return pd.DataFrame(dict(zip(names, np.split(parsed, len(names)))), index=df.index)
+
+
+def load_cars_dataset(path=DATA_PATH) -> pd.DataFrame:
+    """Load and parse the Cars CSV, keeping every raw column.
+
+    Adds ``price``, ``horsepower``, ``cc``, ``perf_sec``, ``torque`` and
+    ``seats``, and converts the label columns to category dtype. Results are
+    memoized per (path, mtime), so repeated calls in one session return the
+    same frame; treat it as read-only and copy before modifying.
+    """
+    path = Path(path).resolve()
+    return _load_cars_dataset(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cars_dataset(path: Path, mtime_ns: int) -> pd.DataFrame:
+    df = read_csv_fast(path, encoding='latin1')
+    df.columns = [c.strip() for c in df.columns]
+
+    # build every derived column first and attach them in one assign call;
+    # label columns become category dtype (int codes instead of Python strs)
+    new_cols = {c: df[c].astype('category') for c in ('Company Names', 'Fuel Types', 'Cars Names')}
+    new_cols['price'] = parse_price_series(df['Cars Prices'])
+    new_cols.update(parse_numeric_columns(df, NUMERIC_SPEC_COLUMNS).items())
+    # plain float64 like the other parsed columns (PyArrow input would give double[pyarrow])
+    new_cols['seats'] = pd.to_numeric(df.get('Seats', ''), errors='coerce').astype('float64')
+
+    return df.assign(**new_cols)
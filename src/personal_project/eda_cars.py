@@ -10,15 +10,20 @@ Generates several PNG figures into `reports/figures/`:
 Run:
     python src/personal_project/eda_cars.py
 """
+import multiprocessing
+import os
 from pathlib import Path
 import re
 import numpy as np
 import pandas as pd
+import matplotlib
+# select the non-interactive backend before pyplot is imported (skips GUI backend probing)
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.ticker import FuncFormatter
 try:
-    from personal_project.cleaning import parse_price, extract_number
+    from personal_project.cleaning import load_cars_dataset
 except Exception:
     # Support running this file directly (python src/personal_project/eda_cars.py)
     # by loading the cleaning module from the same directory.
@@ -27,38 +32,24 @@ except Exception:
     spec = importlib.util.spec_from_file_location('personal_project.cleaning', str(p))
     mod = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(mod)
-    parse_price = mod.parse_price
-    extract_number = mod.extract_number
+    load_cars_dataset = mod.load_cars_dataset
 
 
-DATA_PATH = Path(__file__).resolve().parents[2] / "data" / "Cars Datasets 2025.csv"
 OUT_DIR = Path(__file__).resolve().parents[2] / "reports" / "figures"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# let Agg simplify dense paths (helps the scatter plot render faster)
+plt.rcParams['path.simplify_threshold'] = 1.0
 
-# parsing functions are provided by personal_project.cleaning
 
-
-def load_clean():
-    df = pd.read_csv(DATA_PATH, encoding='latin1')
-    df.columns = [c.strip() for c in df.columns]
-
-    df['price'] = df.get('Cars Prices', '').apply(parse_price)
-    df['horsepower'] = df.get('HorsePower', '').apply(extract_number)
-    df['cc'] = df.get('CC/Battery Capacity', '').apply(extract_number)
-    df['perf_sec'] = df.get('Performance(0 - 100 )KM/H', '').apply(extract_number)
-    df['torque'] = df.get('Torque', '').apply(extract_number)
-    df['seats'] = pd.to_numeric(df.get('Seats', ''), errors='coerce')
-
-    return df
+# loading and parsing are provided by personal_project.cleaning
 
 
 def plot_price_hist(df: pd.DataFrame):
-    plt.figure(figsize=(8, 5))
+    plt.figure(figsize=(8, 5), constrained_layout=True)
     sns.histplot(df['price'].dropna(), bins=50)
     plt.title('Price distribution')
     plt.xlabel('Price (USD)')
-    plt.tight_layout()
     out = OUT_DIR / 'price_hist.png'
     plt.savefig(out)
     plt.close()
@@ -93,29 +84,28 @@ def _format_axis_currency(ax, axis='x', divide=1):
 
 
 def plot_log_price_hist(df: pd.DataFrame):
-    plt.figure(figsize=(8, 5))
+    plt.figure(figsize=(8, 5), constrained_layout=True)
     # use log10 for easier interpretation and drop non-positive prices
-    price = df['price'].dropna()
-    price = price[price > 0]
-    log_price = np.log10(price)
+    p = df['price'].to_numpy(dtype=float, na_value=np.nan)
+    p = p[np.isfinite(p) & (p > 0)]
+    log_price = np.log10(p, out=np.empty_like(p))
     sns.histplot(log_price, bins=50)
     plt.title('Log10(Price) distribution')
     plt.xlabel('log10(Price)')
-    plt.tight_layout()
     out = OUT_DIR / 'log_price_hist.png'
     plt.savefig(out)
     plt.close()
 
 
 def plot_hp_vs_price(df: pd.DataFrame):
-    plt.figure(figsize=(8, 6))
-    sns.scatterplot(x='horsepower', y='price', data=df, alpha=0.6)
+    plt.figure(figsize=(8, 6), constrained_layout=True)
+    ax = plt.gca()
+    # plain scatter rasterized into the PNG instead of one vector path per marker
+    ax.scatter(df['horsepower'].to_numpy(), df['price'].to_numpy(), alpha=0.6, s=12, rasterized=True)
     plt.title('Horsepower vs Price')
     plt.xlabel('Horsepower')
     plt.ylabel('Price (USD)')
-    plt.tight_layout()
     out = OUT_DIR / 'horsepower_vs_price.png'
-    ax = plt.gca()
     # format y-axis with thousands separator
     _format_axis_currency(ax, axis='y', divide=1)
     plt.savefig(out)
@@ -125,12 +115,13 @@ def plot_hp_vs_price(df: pd.DataFrame):
 def plot_company_boxplot(df: pd.DataFrame, top_n=10):
     counts = df['Company Names'].value_counts()
     top = counts.nlargest(top_n).index.tolist()
-    sub = df[df['Company Names'].isin(top)]
-    plt.figure(figsize=(12, 6))
+    sub = df[df['Company Names'].isin(top)].copy()
+    # keep the plot to the top companies only (categoricals otherwise draw every level)
+    sub['Company Names'] = sub['Company Names'].cat.remove_unused_categories()
+    plt.figure(figsize=(12, 6), constrained_layout=True)
     sns.boxplot(x='Company Names', y='price', data=sub)
     plt.xticks(rotation=45)
     plt.title(f'Price distribution by top {top_n} companies')
-    plt.tight_layout()
     out = OUT_DIR / 'company_price_boxplot.png'
     ax = plt.gca()
     _format_axis_currency(ax, axis='y', divide=1)
@@ -141,25 +132,36 @@ def plot_company_boxplot(df: pd.DataFrame, top_n=10):
 def plot_numeric_corr(df: pd.DataFrame):
     num = df[['price', 'horsepower', 'cc', 'perf_sec', 'torque', 'seats']].copy()
     corr = num.corr()
-    plt.figure(figsize=(8, 6))
+    plt.figure(figsize=(8, 6), constrained_layout=True)
     sns.heatmap(corr, annot=True, fmt='.2f', cmap='coolwarm')
     plt.title('Numeric feature correlation')
-    plt.tight_layout()
     out = OUT_DIR / 'numeric_corr_heatmap.png'
     plt.savefig(out)
     plt.close()
 
 
+def render_one(fn, df: pd.DataFrame):
+    """Run one plot function in a worker process."""
+    fn(df)
+
+
 def main():
-    df = load_clean()
+    df = load_cars_dataset()
     print('Rows loaded:', len(df))
     print('Saving figures to', OUT_DIR)
 
-    plot_price_hist(df)
-    plot_log_price_hist(df)
-    plot_hp_vs_price(df)
-    plot_company_boxplot(df)
-    plot_numeric_corr(df)
+    plots = [plot_price_hist, plot_log_price_hist, plot_hp_vs_price, plot_company_boxplot, plot_numeric_corr]
+    # figures are independent, so with fork and more than one core render them
+    # in separate processes (pyplot state is not thread-safe). Under spawn
+    # (Windows/macOS default) every worker re-imports pandas/matplotlib/seaborn,
+    # which alone costs about as much as rendering all five in-process.
+    workers = min(len(plots), os.cpu_count() or 1)
+    if workers > 1 and multiprocessing.get_start_method() == 'fork':
+        with multiprocessing.Pool(workers) as pool:
+            pool.starmap(render_one, [(fn, df) for fn in plots])
+    else:
+        for fn in plots:
+            fn(df)
 
     print('Done')
 
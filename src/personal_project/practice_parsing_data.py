@@ -10,7 +10,9 @@ project root work reliably.
 
 from pathlib import Path
 import csv
-from typing import List, Dict
+import heapq
+import os
+from typing import Any, List, Dict, Tuple
 
 
 def find_sample_csv() -> Path:
@@ -45,9 +47,10 @@ def read_head(path: Path, n: int = 7) -> List[Dict[str, str]]:
 	try:
 		import pandas as pd  # type: ignore
 
-		df = pd.read_csv(path)
-		# convert first n rows to list of dicts for consistent printing
-		return df.head(n).to_dict(orient="records")
+		# stop parsing after n data rows instead of reading the whole file
+		df = pd.read_csv(path, nrows=n, engine="c", memory_map=(os.name == "posix"))
+		# convert rows to list of dicts for consistent printing
+		return df.to_dict(orient="records")
 	except Exception:
 		# fallback to stdlib csv
 		rows = []
@@ -60,14 +63,43 @@ def read_head(path: Path, n: int = 7) -> List[Dict[str, str]]:
 		return rows
 
 
+def top_scores(path: Path, n: int = 10) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+	"""Return the n highest-scoring rows in the file (best first) and score stats over them.
+
+	With pandas this is a single nlargest + agg; otherwise every csv row is read
+	and the top n are picked in Python. Stats keys: sum, mean, max, min.
+	Raises ValueError if a score is not numeric and KeyError if there is no score column.
+	"""
+	try:
+		import pandas as pd  # type: ignore
+	except ImportError:
+		with path.open(newline="", encoding="utf-8") as fh:
+			rows = heapq.nlargest(n, csv.DictReader(fh), key=lambda x: int(x['score']))
+		scores = [int(r['score']) for r in rows]
+		stats = {'max': max(scores), 'min': min(scores), 'sum': sum(scores), 'mean': sum(scores) / len(scores)}
+		return rows, stats
+
+	df = pd.read_csv(path)
+	# non-numeric scores raise ValueError here, as int() does in the fallback
+	df['score'] = pd.to_numeric(df['score'])
+	df = df.nlargest(n, 'score')
+	# mean is taken separately so sum/max/min keep the column's integer dtype
+	stats = df['score'].agg(['sum', 'max', 'min']).to_dict()
+	stats['mean'] = df['score'].mean()
+	return df.to_dict(orient="records"), stats
+
+
 def main() -> None:
     # Load and display sample data
     path = find_sample_csv()
-    data = read_head(path, n=10)  # get up to 10 rows for sorting
     print(f"Using: {path}\n")
 
-    # Sort data by score (highest to lowest)
-    sorted_data = sorted(data, key=lambda x: int(x['score']), reverse=True)
+    # Top 10 rows by score (highest to lowest)
+    try:
+        sorted_data, stats = top_scores(path, n=10)
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Could not rank players: {e}")
+        return
     
     # Print sorted leaderboard
     print("🏆 Leaderboard (by score):")
@@ -80,14 +112,12 @@ def main() -> None:
     
     # Print some basic stats
     try:
-        total_score = sum(int(r['score']) for r in sorted_data)
-        avg_score = total_score / len(sorted_data)
         print("\n📊 Statistics:")
         print(f"Total players: {len(sorted_data)}")
-        print(f"Average score: {avg_score:.1f}")
-        print(f"Top score: {sorted_data[0]['score']} (by {sorted_data[0]['name']})")
-        print(f"Lowest score: {sorted_data[-1]['score']} (by {sorted_data[-1]['name']})")
-    except (ValueError, KeyError) as e:
+        print(f"Average score: {stats['mean']:.1f}")
+        print(f"Top score: {stats['max']} (by {sorted_data[0]['name']})")
+        print(f"Lowest score: {stats['min']} (by {sorted_data[-1]['name']})")
+    except (ValueError, KeyError, IndexError) as e:
         print(f"Could not calculate stats: {e}")
 
 
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from personal_project.cleaning import (
+    extract_number,
+    extract_number_series,
+    load_cars_dataset,
+    parse_numeric_columns,
+    parse_price,
+    parse_price_series,
+)
+
+
+def test_parse_price_series_matches_scalar():
+    raw = pd.Series(["$1,100,000 ", "$12,000-$15,000", "1.2k", "3M", "", None, "n/a"])
+    expected = np.array([parse_price(v) for v in raw])
+    np.testing.assert_allclose(parse_price_series(raw).to_numpy(), expected)
+
+
+def test_extract_number_series_matches_scalar():
+    raw = pd.Series(["963 hp", "70-85 hp", "100 - 140 Nm", "2.5 sec", "", None, "n/a"])
+    expected = np.array([extract_number(v) for v in raw])
+    np.testing.assert_allclose(extract_number_series(raw).to_numpy(), expected)
+
+
+def test_parse_numeric_columns_matches_per_column_parse():
+    df = pd.DataFrame(
+        {"HorsePower": ["963 hp", "70-85 hp", None], "Torque": ["800 Nm", "", "100 - 140 Nm"]},
+        index=[10, 11, 12],
+    )
+    out = parse_numeric_columns(df, {"horsepower": "HorsePower", "torque": "Torque"})
+    assert list(out.columns) == ["horsepower", "torque"]
+    assert list(out.index) == [10, 11, 12]
+    for name, raw in [("horsepower", "HorsePower"), ("torque", "Torque")]:
+        np.testing.assert_allclose(out[name].to_numpy(), extract_number_series(df[raw]).to_numpy())
+
+
+def test_load_cars_dataset_is_memoized():
+    df = load_cars_dataset()
+    assert df is load_cars_dataset()
+    for col in ("price", "horsepower", "cc", "perf_sec", "torque", "seats"):
+        assert col in df.columns
+    assert df["Company Names"].dtype == "category"
+
+
+def test_series_parsers_handle_empty_input():
+    empty = pd.Series([], dtype=object)
+    assert parse_price_series(empty).empty
+    assert extract_number_series(empty).empty
+
+
+def test_series_parsers_keep_rows_with_duplicate_index_separate():
+    raw = pd.Series(["10 hp", "20 hp"], index=[0, 0])
+    np.testing.assert_allclose(extract_number_series(raw).to_numpy(), [10.0, 20.0])
+    prices = pd.Series(["$10", "$20"], index=[0, 0])
+    np.testing.assert_allclose(parse_price_series(prices).to_numpy(), [10.0, 20.0])
+    assert list(extract_number_series(raw).index) == [0, 0]
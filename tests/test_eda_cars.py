@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+
+from personal_project import eda_cars
+
+
+def test_main_writes_all_figures(tmp_path, monkeypatch):
+    monkeypatch.setattr(eda_cars, "OUT_DIR", tmp_path)
+    eda_cars.main()
+    assert sorted(p.name for p in tmp_path.glob("*.png")) == [
+        "company_price_boxplot.png",
+        "horsepower_vs_price.png",
+        "log_price_hist.png",
+        "numeric_corr_heatmap.png",
+        "price_hist.png",
+    ]
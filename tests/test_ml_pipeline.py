@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("pyarrow")
+
+from personal_project import ml_pipeline
+
+CSV = (
+    "Company Names,Cars Names,Engines,CC/Battery Capacity,HorsePower,Total Speed,"
+    "Performance(0 - 100 )KM/H,Cars Prices,Fuel Types,Seats,Torque\n"
+    'FERRARI,SF90,V8,3990 cc,963 hp,340 km/h,2.5 sec,"$1,100,000 ",hybrid,2,800 Nm\n'
+    'Ford,KA+,1.2L,"1,200 cc",70-85 hp,165 km/h,10.5 sec,"$12,000-$15,000",Petrol,5,100 - 140 Nm\n'
+    "Kia,Rio,1.4L,1400 cc,100 hp,180 km/h,11 sec,n/a,Petrol,,130 Nm\n"
+)
+
+
+def test_load_and_clean_parquet_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(ml_pipeline, "CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "cars.csv"
+    path.write_text(CSV, encoding="latin1")
+
+    miss = ml_pipeline.load_and_clean(path)
+    cache_files = list((tmp_path / "cache").glob("cars_clean_*.parquet"))
+    assert len(cache_files) == 1
+    hit = ml_pipeline.load_and_clean(path)
+
+    pd.testing.assert_frame_equal(miss, hit)
+    assert list(miss.columns) == [*ml_pipeline.FEATURES, "price"]
+    assert len(miss) == 2  # the unpriced row is dropped
+
+
+def test_cache_path_changes_with_version(tmp_path, monkeypatch):
+    path = tmp_path / "cars.csv"
+    path.write_text(CSV, encoding="latin1")
+    before = ml_pipeline._cache_path(path)
+    monkeypatch.setattr(ml_pipeline, "CACHE_VERSION", ml_pipeline.CACHE_VERSION + 1)
+    assert ml_pipeline._cache_path(path) != before
+
+
+def test_load_and_clean_rebuilds_corrupt_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(ml_pipeline, "CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "cars.csv"
+    path.write_text(CSV, encoding="latin1")
+    cache_file = ml_pipeline._cache_path(path)
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_bytes(b"PAR1 truncated")
+
+    df = ml_pipeline.load_and_clean(path)
+    assert len(df) == 2
+    pd.testing.assert_frame_equal(pd.read_parquet(cache_file), df)
+
+
+def test_load_and_clean_prunes_stale_cache_entries(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(ml_pipeline, "CACHE_DIR", cache_dir)
+    cache_dir.mkdir()
+    stale = cache_dir / "cars_clean_000000000000.parquet"
+    stale.write_bytes(b"old")
+    path = tmp_path / "cars.csv"
+    path.write_text(CSV, encoding="latin1")
+
+    ml_pipeline.load_and_clean(path)
+    assert sorted(cache_dir.iterdir()) == [ml_pipeline._cache_path(path)]
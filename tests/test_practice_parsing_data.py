@@ -0,0 +1,26 @@
+import pytest
+
+from personal_project.practice_parsing_data import find_sample_csv, top_scores
+
+
+def test_top_scores_sorted_with_stats():
+    rows, stats = top_scores(find_sample_csv(), n=3)
+    assert [r["name"] for r in rows] == ["Jill", "Dana", "Hana"]
+    assert stats["max"] == 2000
+    assert stats["min"] == 1340
+    assert stats["sum"] == 4840
+    assert abs(stats["mean"] - 4840 / 3) < 1e-9
+
+
+def test_top_scores_ranks_whole_file(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_text("id,name,score,level\n1,A,10,1\n2,B,20,1\n3,C,30,1\n4,D,40,1\n")
+    rows, _ = top_scores(path, n=2)
+    assert [r["name"] for r in rows] == ["D", "C"]
+
+
+def test_top_scores_rejects_non_numeric_score(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_text("id,name,score,level\n1,A,ten,1\n2,B,20,1\n")
+    with pytest.raises(ValueError):
+        top_scores(path, n=2)